@@ -1,11 +1,15 @@
 import os
+import re
+import bisect
+import functools
 import smtplib
 import requests
 import json
 import glob
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.image import MIMEImage
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
 from datetime import datetime
 from dotenv import load_dotenv
 from email.utils import formataddr
@@ -19,8 +23,205 @@ except ImportError:
     print("⚠️ Visual query engine not available - charts will be skipped")
     VISUAL_ENGINE_AVAILABLE = False
 
+# Prefer orjson's C parser for regime score files, fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Minify the outgoing HTML to shrink the SMTP payload; fall back to a simple
+# inter-tag whitespace collapse when minify_html is not installed
+try:
+    import minify_html
+
+    def _minify(html_str):
+        return minify_html.minify(html_str, minify_css=True, keep_closing_tags=True)
+except ImportError:
+    _INTER_TAG_WS = re.compile(r">\s+<")
+
+    def _minify(html_str):
+        return _INTER_TAG_WS.sub("><", html_str)
+
 load_dotenv(dotenv_path="config/.env")
 
+@dataclass(frozen=True)
+class SMTPConfig:
+    """SMTP settings read once from the environment after load_dotenv."""
+    user: str
+    password: str
+    to: str
+    sender_email: str
+    sender_name: str
+    server: str
+    port: int
+    subject: str
+
+def _load_smtp_cfg():
+    """Build the SMTP config from environment variables (reloadable in tests)."""
+    return SMTPConfig(
+        user=str(os.getenv("SMTP_USER") or ""),
+        password=str(os.getenv("SMTP_PASSWORD") or ""),
+        to=str(os.getenv("EMAIL_TO") or ""),
+        sender_email=str(os.getenv("EMAIL_SENDER") or "noreply@macrointel.com"),
+        sender_name=os.getenv("EMAIL_SENDER_NAME", "MacroIntel Bot"),
+        server=str(os.getenv("SMTP_SERVER") or "smtp.gmail.com"),
+        port=int(os.getenv("SMTP_PORT", 587)),
+        subject=os.getenv("EMAIL_SUBJECT", "MacroIntel Daily News Report")
+    )
+
+_SMTP_CFG = _load_smtp_cfg()
+
+# Fear & Greed classification emoji map, built once at import
+_FG_EMOJI = {
+    "extreme fear": "😱",
+    "fear": "😨",
+    "neutral": "😐",
+    "greed": "😏",
+    "extreme greed": "🤑"
+}
+
+# Extracts the numeric score from the Fear & Greed summary string
+_FG_SCORE_RE = re.compile(r"Fear & Greed Index: (\d+)")
+
+class _ChartUnavailable(Exception):
+    """Raised so lru_cache never memoizes a failed chart render."""
+
+@functools.lru_cache(maxsize=8)
+def _render_extreme_fear_chart(date_key, score_bucket):
+    chart_path = generate_extreme_fear_chart()
+    if chart_path is None:
+        raise _ChartUnavailable()
+    return chart_path
+
+def _cached_extreme_fear_chart(date_key, score_bucket):
+    """
+    Render the extreme fear chart at most once per day and 5-point score
+    bucket; repeated same-day sends reuse the cached chart path instead of
+    re-running matplotlib. A failed render is not cached, so the next send
+    retries instead of losing the chart for the rest of the day. Call
+    _render_extreme_fear_chart.cache_clear() to force a re-render.
+    """
+    try:
+        return _render_extreme_fear_chart(date_key, score_bucket)
+    except _ChartUnavailable:
+        return None
+
+# Static fallback blocks for the regime summary section
+_REGIME_FALLBACK_NA = """
+        <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0; border-left: 4px solid #6c757d;">
+            <h3>📊 Market Regime Summary</h3>
+            <p><em>Regime score data not available</em></p>
+        </div>
+        """
+
+_REGIME_FALLBACK_ERR = """
+        <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0; border-left: 4px solid #6c757d;">
+            <h3>📊 Market Regime Summary</h3>
+            <p><em>Error loading regime score data</em></p>
+        </div>
+        """
+
+# Document head (including the style block) and report header, built once;
+# only the generation timestamp and article count vary per report
+_REPORT_HEADER_TEMPLATE = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <style>
+            body {{ font-family: Arial, sans-serif; margin: 20px; }}
+            .header {{ background: #2c3e50; color: white; padding: 20px; border-radius: 5px; }}
+            .article {{ border-left: 4px solid #3498db; margin: 15px 0; padding: 10px; background: #f8f9fa; }}
+            .title {{ font-weight: bold; color: #2c3e50; margin-bottom: 5px; }}
+            .summary {{ color: #555; margin: 5px 0; }}
+            .tickers {{ color: #e74c3c; font-weight: bold; }}
+            .tone {{ display: inline-block; padding: 2px 8px; border-radius: 3px; font-size: 12px; }}
+            .tone-bullish {{ background: #d4edda; color: #155724; }}
+            .tone-bearish {{ background: #f8d7da; color: #721c24; }}
+            .tone-neutral {{ background: #d1ecf1; color: #0c5460; }}
+            .tone-volatile {{ background: #fff3cd; color: #856404; }}
+            .visuals {{ background: #ecf0f1; padding: 15px; border-radius: 5px; margin: 20px 0; }}
+            .footer {{ margin-top: 30px; padding: 15px; background: #95a5a6; color: white; border-radius: 5px; }}
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h1>📰 MacroIntel Daily News Report</h1>
+            <p>Generated on {generated_at}</p>
+            <p>📊 {article_count} relevant articles from your watchlist</p>
+        </div>
+
+        {regime_summary}
+
+        <div class="visuals">
+            <h2>📈 Market Overview</h2>
+            <p><strong>{fear_greed}</strong></p>
+            {sector_heatmap}
+            {sentiment_gauge}
+        </div>
+
+        {extreme_fear_chart}
+
+        <h2>📰 Relevant Headlines</h2>
+    """
+
+_REPORT_FOOTER_TEMPLATE = """
+        <div class="footer">
+            <p><strong>MacroIntel News Scanner</strong></p>
+            <p>This report contains {article_count} articles relevant to your watchlist.</p>
+            <p>Generated automatically - click article titles to read full stories.</p>
+        </div>
+    </body>
+    </html>
+    """
+
+# Component score color bands: red / orange / gray / green / teal
+_COMPONENT_COLOR_BOUNDS = (30, 50, 70, 85)
+_COMPONENT_COLORS = ('#dc3545', '#fd7e14', '#6c757d', '#28a745', '#20c997')
+
+# Per-component HTML block for the regime summary breakdown
+_COMPONENT_TEMPLATE = """
+                    <div style="border-left: 3px solid {color}; padding-left: 10px;">
+                        <strong>{name}:</strong> {score:.1f}/100<br>
+                        <small style="color: #6c757d;">{interpretation}</small>
+                    </div>
+                """
+
+def _component_color(raw_score):
+    """Map a 0-100 component score to its display color."""
+    return _COMPONENT_COLORS[bisect.bisect_right(_COMPONENT_COLOR_BOUNDS, raw_score)]
+
+# Single-pass HTML escaping for user-supplied article fields
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;"
+})
+
+def _esc(text):
+    """Escape HTML special characters in one C-level pass."""
+    return text.translate(_HTML_ESCAPE_TABLE) if text else text
+
+# CSS class per article tone, precomputed instead of formatted per article
+_TONE_CLASS = {t: f"tone-{t}" for t in ("bullish", "bearish", "neutral", "volatile")}
+
+# Per-article HTML block, compiled once instead of re-built per iteration
+_ARTICLE_TEMPLATE = """
+        <div class="article">
+            <div class="title">
+                <a href="{url}" style="color: #2c3e50; text-decoration: none;">{i}. {title}</a>
+            </div>
+            <div class="summary">{summary}</div>
+            <div style="margin-top: 5px;">
+                <span class="tickers">📈 {tickers}</span> |
+                <span class="tone {tone_class}">{tone}</span> |
+                <small>Source: {source}</small>
+            </div>
+        </div>
+        """
+
 def load_regime_score_data():
     """
     Load the most recent regime score data from output directory.
@@ -30,21 +231,28 @@ def load_regime_score_data():
     """
     try:
         # Look for regime score files in output directory
-        output_dir = Path("output")
-        if not output_dir.exists():
+        if not os.path.isdir("output"):
             return None
-        
-        # Find all regime score files
-        regime_files = list(output_dir.glob("regime_score_*.json"))
-        if not regime_files:
+
+        # Stream directory entries and keep only the most recent file;
+        # DirEntry.stat() reuses data from the directory scan where the OS allows
+        with os.scandir("output") as entries:
+            latest_entry = max(
+                (e for e in entries
+                 if e.name.startswith("regime_score_") and e.name.endswith(".json")),
+                key=lambda e: e.stat().st_mtime,
+                default=None
+            )
+        if latest_entry is None:
             return None
-        
-        # Get the most recent file
-        latest_file = max(regime_files, key=lambda x: x.stat().st_mtime)
-        
-        # Load and parse the JSON data
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            regime_data = json.load(f)
+
+        latest_file = Path(latest_entry.path)
+
+        # Load and parse the JSON data in one read
+        if ORJSON_AVAILABLE:
+            regime_data = orjson.loads(latest_file.read_bytes())
+        else:
+            regime_data = json.loads(latest_file.read_bytes())
         
         print(f"✅ Loaded regime score data from: {latest_file}")
         return regime_data
@@ -64,12 +272,7 @@ def generate_regime_summary_html(regime_data):
         HTML string for regime summary section
     """
     if not regime_data:
-        return """
-        <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0; border-left: 4px solid #6c757d;">
-            <h3>📊 Market Regime Summary</h3>
-            <p><em>Regime score data not available</em></p>
-        </div>
-        """
+        return _REGIME_FALLBACK_NA
     
     try:
         total_score = regime_data.get('total_score', 0)
@@ -116,31 +319,17 @@ def generate_regime_summary_html(regime_data):
                 <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px;">
         """
         
-        # Add component scores
-        for component, data in component_breakdown.items():
-            if isinstance(data, dict):
-                raw_score = data.get('raw_score', 0)
-                interpretation = data.get('interpretation', '')
-                
-                # Determine component color
-                if raw_score < 30:
-                    comp_color = '#dc3545'  # Red for low scores
-                elif raw_score < 50:
-                    comp_color = '#fd7e14'  # Orange for moderate scores
-                elif raw_score < 70:
-                    comp_color = '#6c757d'  # Gray for neutral scores
-                elif raw_score < 85:
-                    comp_color = '#28a745'  # Green for good scores
-                else:
-                    comp_color = '#20c997'  # Teal for excellent scores
-                
-                component_name = component.replace('_', ' ').title()
-                html += f"""
-                    <div style="border-left: 3px solid {comp_color}; padding-left: 10px;">
-                        <strong>{component_name}:</strong> {raw_score:.1f}/100<br>
-                        <small style="color: #6c757d;">{interpretation}</small>
-                    </div>
-                """
+        # Add component scores in a single join instead of repeated +=
+        html += "".join(
+            _COMPONENT_TEMPLATE.format(
+                color=_component_color(data.get('raw_score', 0)),
+                name=component.replace('_', ' ').title(),
+                score=data.get('raw_score', 0),
+                interpretation=data.get('interpretation', '')
+            )
+            for component, data in component_breakdown.items()
+            if isinstance(data, dict)
+        )
         
         html += """
                 </div>
@@ -152,12 +341,7 @@ def generate_regime_summary_html(regime_data):
         
     except Exception as e:
         print(f"⚠️ Error generating regime summary HTML: {e}")
-        return """
-        <div style="background: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0; border-left: 4px solid #6c757d;">
-            <h3>📊 Market Regime Summary</h3>
-            <p><em>Error loading regime score data</em></p>
-        </div>
-        """
+        return _REGIME_FALLBACK_ERR
 
 def generate_fear_greed_placeholder():
     """Generate Fear & Greed index using real API or fallback to placeholder"""
@@ -182,18 +366,11 @@ def generate_fear_greed_placeholder():
             score = data.get("fear_and_greed", {}).get("score", 50)
             classification = data.get("fear_and_greed", {}).get("rating", "Neutral")
             
-            # Map classification to emoji and description
-            classification_map = {
-                "extreme fear": "😱",
-                "fear": "😨", 
-                "neutral": "😐",
-                "greed": "😏",
-                "extreme greed": "🤑"
-            }
-            
-            emoji = classification_map.get(classification.lower(), "📊")
-            
-            return f"Fear & Greed Index: {score} ({classification.title()}) {emoji} - Market showing {classification} sentiment"
+            # Map classification to emoji, lowercasing once for both uses
+            classification_lower = classification.lower()
+            emoji = _FG_EMOJI.get(classification_lower, "📊")
+
+            return f"Fear & Greed Index: {score} ({classification.title()}) {emoji} - Market showing {classification_lower} sentiment"
         else:
             print(f"⚠️ Fear & Greed API error: {response.status_code}")
             return "Fear & Greed Index: 65 (Greed) - Market showing moderate optimism [API Error]"
@@ -243,188 +420,228 @@ def generate_sentiment_gauge_placeholder():
     
     return gauge_html
 
-def generate_email_content(articles, limit=25):
+def build_report_context(articles, limit=25):
+    """
+    Build the shared data context used by both HTML and text reports.
+
+    Fetches regime data, the Fear & Greed reading, and the extreme fear chart
+    once (concurrently) so rendering both report flavors does not repeat
+    network calls or chart work.
+
+    Args:
+        articles: List of summarized articles
+        limit: Maximum articles to include
+
+    Returns:
+        Dict with articles, regime_data, fear_greed, chart_path, generated_at
+    """
+    # Regime load (disk), Fear & Greed (network) and chart generation (CPU)
+    # are independent, so run them concurrently instead of serially
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        regime_future = executor.submit(load_regime_score_data)
+        fear_greed_future = executor.submit(generate_fear_greed_placeholder)
+        fear_greed = fear_greed_future.result()
+
+        chart_future = None
+        if VISUAL_ENGINE_AVAILABLE:
+            # Key the chart cache on today's date and the 5-point score bucket
+            score_match = _FG_SCORE_RE.search(fear_greed)
+            score = int(score_match.group(1)) if score_match else 50
+            chart_future = executor.submit(
+                _cached_extreme_fear_chart, datetime.now().toordinal(), score // 5)
+
+        regime_data = regime_future.result()
+
+    chart_path = None
+    if chart_future is not None:
+        try:
+            chart_path = chart_future.result()
+        except Exception as e:
+            print(f"⚠️ Error generating extreme fear chart: {str(e)}")
+
+    return {
+        "articles": articles[:limit],
+        "regime_data": regime_data,
+        "fear_greed": fear_greed,
+        "chart_path": chart_path,
+        "generated_at": datetime.now()
+    }
+
+def generate_email_content(articles, limit=25, context=None):
     """
     Generate HTML email content with articles, summaries, and visuals
-    
+
     Args:
         articles: List of summarized articles
         limit: Maximum articles to include
-    
+        context: Optional pre-built context from build_report_context
+
     Returns:
         HTML string for email body
     """
-    # Limit articles
-    articles_to_include = articles[:limit]
-    
-    # Load regime score data
-    regime_data = load_regime_score_data()
-    regime_summary_html = generate_regime_summary_html(regime_data)
-    
+    if context is None:
+        context = build_report_context(articles, limit)
+
+    articles_to_include = context["articles"]
+    fear_greed = context["fear_greed"]
+    regime_summary_html = generate_regime_summary_html(context["regime_data"])
+
     # Generate visual placeholders
-    fear_greed = generate_fear_greed_placeholder()
     sector_heatmap = generate_sector_heatmap_placeholder()
     sentiment_gauge = generate_sentiment_gauge_placeholder()
-    
+
     # Check for extreme fear chart
     extreme_fear_chart_html = ""
-    if VISUAL_ENGINE_AVAILABLE:
-        try:
-            chart_path = generate_extreme_fear_chart()
-            if chart_path and os.path.exists(chart_path):
-                extreme_fear_chart_html = f"""
-                <div style="margin: 20px 0; padding: 15px; background: #2c3e50; border-radius: 5px;">
-                    <h3>😱 Extreme Fear Alert - Asset Performance Analysis</h3>
-                    <p>Market fear detected! Here's how key assets are performing during this period:</p>
-                    <img src="cid:fear_chart" style="width: 100%; max-width: 600px; height: auto; border-radius: 5px;">
-                    <p><small>Chart shows 1-year performance comparison of BTC, Gold, and QQQ</small></p>
-                </div>
-                """
-        except Exception as e:
-            print(f"⚠️ Error generating extreme fear chart: {str(e)}")
+    chart_path = context["chart_path"]
+    if chart_path and os.path.exists(chart_path):
+        extreme_fear_chart_html = """
+        <div style="margin: 20px 0; padding: 15px; background: #2c3e50; border-radius: 5px;">
+            <h3>😱 Extreme Fear Alert - Asset Performance Analysis</h3>
+            <p>Market fear detected! Here's how key assets are performing during this period:</p>
+            <img src="cid:fear_chart" style="width: 100%; max-width: 600px; height: auto; border-radius: 5px;">
+            <p><small>Chart shows 1-year performance comparison of BTC, Gold, and QQQ</small></p>
+        </div>
+        """
     
     # Start HTML content
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .header {{ background: #2c3e50; color: white; padding: 20px; border-radius: 5px; }}
-            .article {{ border-left: 4px solid #3498db; margin: 15px 0; padding: 10px; background: #f8f9fa; }}
-            .title {{ font-weight: bold; color: #2c3e50; margin-bottom: 5px; }}
-            .summary {{ color: #555; margin: 5px 0; }}
-            .tickers {{ color: #e74c3c; font-weight: bold; }}
-            .tone {{ display: inline-block; padding: 2px 8px; border-radius: 3px; font-size: 12px; }}
-            .tone-bullish {{ background: #d4edda; color: #155724; }}
-            .tone-bearish {{ background: #f8d7da; color: #721c24; }}
-            .tone-neutral {{ background: #d1ecf1; color: #0c5460; }}
-            .tone-volatile {{ background: #fff3cd; color: #856404; }}
-            .visuals {{ background: #ecf0f1; padding: 15px; border-radius: 5px; margin: 20px 0; }}
-            .footer {{ margin-top: 30px; padding: 15px; background: #95a5a6; color: white; border-radius: 5px; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>📰 MacroIntel Daily News Report</h1>
-            <p>Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
-            <p>📊 {len(articles_to_include)} relevant articles from your watchlist</p>
-        </div>
-        
-        {regime_summary_html}
-        
-        <div class="visuals">
-            <h2>📈 Market Overview</h2>
-            <p><strong>{fear_greed}</strong></p>
-            {sector_heatmap}
-            {sentiment_gauge}
-        </div>
-        
-        {extreme_fear_chart_html}
-        
-        <h2>📰 Relevant Headlines</h2>
-    """
+    html_content = _REPORT_HEADER_TEMPLATE.format(
+        generated_at=context["generated_at"].strftime('%B %d, %Y at %I:%M %p'),
+        article_count=len(articles_to_include),
+        regime_summary=regime_summary_html,
+        fear_greed=fear_greed,
+        sector_heatmap=sector_heatmap,
+        sentiment_gauge=sentiment_gauge,
+        extreme_fear_chart=extreme_fear_chart_html
+    )
     
     # Add articles
+    article_blocks = []
     for i, article in enumerate(articles_to_include, 1):
-        title = article.get("title", "No title")
-        url = article.get("url", "#")
-        summary = article.get("summary", "No summary available")
-        tickers = article.get("affected_tickers", "")
         tone = article.get("tone", "Neutral")
-        source = article.get("source", "unknown")
-        
-        # Determine tone class
-        tone_class = f"tone-{tone.lower()}"
-        
-        html_content += f"""
-        <div class="article">
-            <div class="title">
-                <a href="{url}" style="color: #2c3e50; text-decoration: none;">{i}. {title}</a>
-            </div>
-            <div class="summary">{summary}</div>
-            <div style="margin-top: 5px;">
-                <span class="tickers">📈 {tickers}</span> | 
-                <span class="tone {tone_class}">{tone}</span> | 
-                <small>Source: {source}</small>
-            </div>
-        </div>
-        """
+        article_blocks.append(_ARTICLE_TEMPLATE.format(
+            i=i,
+            url=article.get("url", "#"),
+            title=_esc(article.get("title", "No title")),
+            summary=_esc(article.get("summary", "No summary available")),
+            tickers=_esc(article.get("affected_tickers", "")),
+            tone=_esc(tone),
+            tone_class=_TONE_CLASS.get(tone.lower(), "tone-neutral"),
+            source=_esc(article.get("source", "unknown"))
+        ))
+    html_content += "".join(article_blocks)
     
     # Add footer
-    html_content += f"""
-        <div class="footer">
-            <p><strong>MacroIntel News Scanner</strong></p>
-            <p>This report contains {len(articles_to_include)} articles relevant to your watchlist.</p>
-            <p>Generated automatically - click article titles to read full stories.</p>
-        </div>
-    </body>
-    </html>
+    html_content += _REPORT_FOOTER_TEMPLATE.format(article_count=len(articles_to_include))
+
+    return _minify(html_content)
+
+class SMTPClient:
     """
-    
-    return html_content
+    Context-managed SMTP connection that can be reused across multiple sends.
 
-def send_daily_report(html_content, attachments=None):
+    Opening a connection, negotiating STARTTLS, and logging in costs several
+    round-trips per email; batch callers should build one client and pass it
+    to send_daily_report for each message so that handshake happens once.
+    """
+
+    def __init__(self, server, port, user, password):
+        self.server = server
+        self.port = port
+        self.user = user
+        self.password = password
+        self.connection = None
+
+    def connect(self):
+        """Open (or reopen) the SMTP connection and authenticate."""
+        self.connection = smtplib.SMTP(self.server, self.port)
+        self.connection.starttls()
+        self.connection.login(self.user, self.password)
+        return self.connection
+
+    def send(self, sender, recipients, message_bytes):
+        """Send a serialized message, reconnecting if the server dropped us."""
+        if self.connection is None:
+            self.connect()
+        try:
+            self.connection.noop()
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPException):
+            self.connect()
+        self.connection.sendmail(sender, recipients, message_bytes)
+
+    def close(self):
+        """Close the connection if it is still open."""
+        if self.connection is not None:
+            try:
+                self.connection.quit()
+            except Exception:
+                pass
+            self.connection = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def send_daily_report(html_content, attachments=None, client=None):
     """
     Send the daily report email with the provided HTML content as the body.
     Args:
         html_content: The full HTML string to use as the email body.
         attachments: List of file paths to attach (optional)
+        client: Optional SMTPClient to reuse an open connection (optional)
     Returns:
         True if sent successfully, False otherwise.
     """
-    # Load credentials using os.getenv()
-    smtp_user = os.getenv("SMTP_USER")
-    smtp_password = os.getenv("SMTP_PASSWORD")
-    email_to = os.getenv("EMAIL_TO")
-    
-    # Additional email settings
-    sender_email = os.getenv("EMAIL_SENDER")
-    sender_name = os.getenv("EMAIL_SENDER_NAME", "MacroIntel Bot")
-    smtp_server = os.getenv("SMTP_SERVER")
-    smtp_port = int(os.getenv("SMTP_PORT", 587))
-    subject = os.getenv("EMAIL_SUBJECT", "MacroIntel Daily News Report")
+    # SMTP settings are read once at import into _SMTP_CFG
+    cfg = _SMTP_CFG
 
     # Validate required credentials
-    if not all([smtp_user, smtp_password, email_to]):
+    if not all([cfg.user, cfg.password, cfg.to]):
         print("[ERROR] Missing required email credentials: SMTP_USER, SMTP_PASSWORD, or EMAIL_TO")
         return False
 
-    # Ensure all required fields are strings
-    smtp_user = str(smtp_user)
-    smtp_password = str(smtp_password)
-    email_to = str(email_to)
-    sender_email = str(sender_email) if sender_email else "noreply@macrointel.com"
-    smtp_server = str(smtp_server) if smtp_server else "smtp.gmail.com"
+    print(f"[INFO] Sending email to {cfg.to}")
 
-    print(f"[INFO] Sending email to {email_to}")
+    # policy.SMTP gives proper CRLF handling and a faster BytesGenerator path
+    msg = EmailMessage(policy=SMTP_POLICY)
+    msg['Subject'] = cfg.subject
+    msg['From'] = formataddr((cfg.sender_name, cfg.sender_email))
+    msg['To'] = cfg.to
 
-    msg = MIMEMultipart('alternative')
-    msg['Subject'] = subject
-    msg['From'] = formataddr((sender_name, sender_email))
-    msg['To'] = email_to
+    # Plain-text fallback plus the HTML body as multipart/alternative
+    msg.set_content("This report is best viewed in an HTML-capable mail client.")
+    msg.add_alternative(html_content, subtype='html')
 
-    # Attach the HTML content
-    msg.attach(MIMEText(html_content, 'html'))
-
-    # Add attachments if provided
+    # Add attachments if provided; add_attachment hands the bytes straight to
+    # the content manager instead of copying them through a MIMEImage wrapper
     if attachments:
         for attachment_path in attachments:
             try:
-                with open(attachment_path, 'rb') as f:
-                    attachment = MIMEImage(f.read())
-                    attachment.add_header('Content-Disposition', 'attachment', 
-                                        filename=os.path.basename(attachment_path))
-                    msg.attach(attachment)
-                print(f"[INFO] Attached: {os.path.basename(attachment_path)}")
+                path = Path(attachment_path)
+                subtype = path.suffix.lstrip('.').lower() or 'png'
+                with open(path, 'rb') as f:
+                    msg.add_attachment(f.read(), maintype='image',
+                                       subtype=subtype, filename=path.name)
+                print(f"[INFO] Attached: {path.name}")
             except Exception as e:
                 print(f"[WARNING] Failed to attach {attachment_path}: {e}")
 
+    # Serialize the MIME tree (including attachment encoding) exactly once;
+    # a comma-separated EMAIL_TO becomes multiple RCPT TO in one transaction
+    raw_message = msg.as_bytes()
+    recipients = [r.strip() for r in cfg.to.split(",") if r.strip()]
+
     try:
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(smtp_user, smtp_password)
-            server.sendmail(sender_email, email_to, msg.as_string())
+        if client is not None:
+            # Reuse the caller's open connection (batch dispatch)
+            client.send(cfg.sender_email, recipients, raw_message)
+        else:
+            with smtplib.SMTP(cfg.server, cfg.port) as server:
+                server.starttls()
+                server.login(cfg.user, cfg.password)
+                server.sendmail(cfg.sender_email, recipients, raw_message)
         print("[SUCCESS] Email sent successfully")
         return True
     except Exception as e:
@@ -433,26 +650,30 @@ def send_daily_report(html_content, attachments=None):
         traceback.print_exc()
         return False
 
-def generate_text_report(articles, limit=25):
+def generate_text_report(articles, limit=25, context=None):
     """
     Generate plain text version of the report (fallback)
-    
+
     Args:
         articles: List of summarized articles
         limit: Maximum articles to include
-    
+        context: Optional pre-built context from build_report_context
+
     Returns:
         Plain text string
     """
-    articles_to_include = articles[:limit]
-    
+    if context is None:
+        context = build_report_context(articles, limit)
+
+    articles_to_include = context["articles"]
+
     text_content = f"""
 📰 MacroIntel Daily News Report
-Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
+Generated on {context["generated_at"].strftime('%B %d, %Y at %I:%M %p')}
 📊 {len(articles_to_include)} relevant articles from your watchlist
 
 📈 Market Overview:
-{generate_fear_greed_placeholder()}
+{context["fear_greed"]}
 
 📰 Relevant Headlines:
 """
@@ -12,14 +12,19 @@ This module integrates all data sources and generates comprehensive reports with
 
 import os
 import sys
+import time
 import json
 import pandas as pd
 import numpy as np
 import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
 import logging
+from dataclasses import dataclass, field
+from enum import IntEnum
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
 # Add project root to Python path
@@ -32,27 +37,134 @@ load_dotenv(dotenv_path=project_root / "config" / ".env")
 # Import local modules
 from core.enhanced_visualizations import EnhancedVisualizations
 
+# Prefer orjson's C serializer (handles numpy scalars and datetimes natively,
+# so default=str is rarely invoked); fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Numba JIT-compiles the integer scoring kernel when installed; otherwise the
+# plain-Python function is used as-is
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+class VixStatus(IntEnum):
+    """Integer codes for the VIX status strings used in regime scoring."""
+    NONE = 0
+    LOW = 1
+    NORMAL = 2
+    HIGH = 3
+
+class FearGreedStatus(IntEnum):
+    """Integer codes for the Fear & Greed status strings used in regime scoring."""
+    NONE = 0
+    EXTREME_FEAR = 1
+    FEAR = 2
+    NEUTRAL = 3
+    GREED = 4
+    EXTREME_GREED = 5
+
+_VIX_STATUS_CODE = {'Low': int(VixStatus.LOW), 'Normal': int(VixStatus.NORMAL), 'High': int(VixStatus.HIGH)}
+_FG_STATUS_CODE = {
+    'Extreme Fear': int(FearGreedStatus.EXTREME_FEAR),
+    'Fear': int(FearGreedStatus.FEAR),
+    'Neutral': int(FearGreedStatus.NEUTRAL),
+    'Greed': int(FearGreedStatus.GREED),
+    'Extreme Greed': int(FearGreedStatus.EXTREME_GREED)
+}
+
+@njit(cache=True)
+def _score_regime(vix_status, fg_status, bullish, bearish, has_trends):
+    """Accumulate the regime score over fixed integer codes.
+
+    Returns (score, indicator_count); code 0 means the indicator is missing.
+    """
+    score = 0
+    count = 0
+    if vix_status > 0:
+        if vix_status == 3:    # High
+            score -= 2
+        elif vix_status == 1:  # Low
+            score += 1
+        count += 1
+    if fg_status > 0:
+        if fg_status == 1:     # Extreme Fear - contrarian bullish signal
+            score += 2
+        elif fg_status == 5:   # Extreme Greed - contrarian bearish signal
+            score -= 2
+        elif fg_status == 2:   # Fear
+            score += 1
+        elif fg_status == 4:   # Greed
+            score -= 1
+        count += 1
+    if has_trends:
+        if bullish > bearish:
+            score += 1
+        elif bearish > bullish:
+            score -= 1
+        count += 1
+    return score, count
+
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
+class MarketSnapshot:
+    """
+    Validated, array-backed view of raw data_sources built once per report.
+
+    Collapses the repeated 'key in data_sources and ... is not None' checks
+    into single attribute loads for the analyzers.
+    """
+    vix_close: Optional[np.ndarray] = None
+    fear_greed: Optional[np.ndarray] = None
+    asset_summary: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    n_assets: int = 0
+    calendar: Optional[Dict[str, Any]] = None
+
+def _atomic_write(path, data):
+    """Write bytes to a temp file then os.replace so readers never see a partial file.
+
+    Uses raw os.open/os.write rather than a buffered file object: the payload
+    is a single bytes blob, so buffering only adds a copy.
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0), 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
 class EnhancedReportBuilder:
-    def __init__(self):
-        """Initialize the enhanced report builder."""
-        self.output_dir = "output"
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Initialize visualization engine
-        self.viz_engine = EnhancedVisualizations()
-        
-        # Market regime thresholds
-        self.regime_thresholds = {
-            'vix_high': 30,
-            'vix_low': 15,
-            'fear_greed_extreme_fear': 25,
-            'fear_greed_extreme_greed': 75,
-            'market_volatility_high': 0.03,  # 3% daily volatility
-            'market_volatility_low': 0.01    # 1% daily volatility
-        }
-        
-        # Strategy playbook
-        self.strategy_playbook = {
+    # Market regime thresholds, shared read-only across instances
+    regime_thresholds = MappingProxyType({
+        'vix_high': 30,
+        'vix_low': 15,
+        'fear_greed_extreme_fear': 25,
+        'fear_greed_extreme_greed': 75,
+        'market_volatility_high': 0.03,  # 3% daily volatility
+        'market_volatility_low': 0.01    # 1% daily volatility
+    })
+
+    # Hot-path comparison thresholds as plain class floats
+    _VIX_HIGH = 30.0
+    _VIX_LOW = 15.0
+    _FG_EXTREME_FEAR = 25.0
+    _FG_EXTREME_GREED = 75.0
+
+    # Strategy playbook, immutable and shared across instances
+    strategy_playbook = MappingProxyType({
+        name: MappingProxyType(config) for name, config in {
             'trend_following': {
                 'conditions': ['bullish_trend', 'low_volatility', 'neutral_sentiment'],
                 'description': 'Follow established trends with tight risk management',
@@ -83,8 +195,49 @@ class EnhancedReportBuilder:
                 'risk_level': 'Medium',
                 'position_sizing': 'Normal'
             }
-        }
+        }.items()
+    })
+
+    def __init__(self):
+        """Initialize the enhanced report builder."""
+        self.output_dir = "output"
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # Resolve the output directory Path once and reuse it for every write
+        self._output_dir_path = Path(self.output_dir)
         
+        # Initialize visualization engine
+        self.viz_engine = EnhancedVisualizations()
+
+        # Regime score memo keyed on the output directory's mtime; repeat
+        # calls skip the rescan and reparse while the directory is unchanged
+        self._regime_cache = None
+        self._regime_cache_key = None
+
+        # Single background writer so report IO overlaps the next report's
+        # computation during batch runs
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        
+        # Strategy decision table: (regime, vix_low, extreme_fear) -> primary
+        # strategy for confident regimes; anything else is opportunistic
+        self._primary_map = {
+            ('Bullish', True, False): 'trend_following',
+            ('Bullish', True, True): 'trend_following',
+            ('Bullish', False, False): 'momentum',
+            ('Bullish', False, True): 'momentum',
+            ('Bearish', True, True): 'mean_reversion',
+            ('Bearish', False, True): 'mean_reversion',
+            ('Bearish', True, False): 'defensive',
+            ('Bearish', False, False): 'defensive'
+        }
+        self._secondary_map = {
+            'trend_following': 'momentum',
+            'mean_reversion': 'defensive',
+            'defensive': 'opportunistic',
+            'momentum': 'trend_following',
+            'opportunistic': 'trend_following'
+        }
+
         print("📊 Enhanced Report Builder initialized")
     
     def load_regime_score_data(self) -> Optional[Dict[str, Any]]:
@@ -95,34 +248,122 @@ class EnhancedReportBuilder:
             Dict containing regime score data or None if not found
         """
         try:
-            # Look for regime score files in output directory
-            output_dir = Path("output")
-            if not output_dir.exists():
+            # Short-circuit when the output directory has not changed
+            try:
+                cache_key = os.stat(self.output_dir).st_mtime_ns
+            except FileNotFoundError:
                 return None
-            
-            # Find all regime score files
-            regime_files = list(output_dir.glob("regime_score_*.json"))
-            if not regime_files:
+            if cache_key == self._regime_cache_key:
+                return self._regime_cache
+
+            # Stream directory entries in one readdir pass; DirEntry.stat()
+            # reuses data gathered during the scan where the OS provides it
+            try:
+                with os.scandir(self.output_dir) as entries:
+                    latest_entry = max(
+                        (e for e in entries
+                         if e.is_file()
+                         and e.name.startswith("regime_score_")
+                         and e.name.endswith(".json")),
+                        key=lambda e: e.stat().st_mtime,
+                        default=None
+                    )
+            except FileNotFoundError:
                 return None
-            
-            # Get the most recent file
-            latest_file = max(regime_files, key=lambda x: x.stat().st_mtime)
-            
-            # Load and parse the JSON data
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                regime_data = json.load(f)
+
+            if latest_entry is None:
+                return None
+
+            latest_file = latest_entry.path
+
+            # Load and parse the JSON data in one read
+            raw = Path(latest_file).read_bytes()
+            regime_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             
             print(f"✅ Loaded regime score data from: {latest_file}")
+            self._regime_cache = regime_data
+            self._regime_cache_key = cache_key
             return regime_data
-            
-        except Exception as e:
+
+        # OSError covers missing/unreadable files; JSONDecodeError (stdlib and
+        # orjson) subclasses ValueError. Programming bugs propagate instead of
+        # silently returning None
+        except (OSError, ValueError) as e:
             print(f"⚠️ Error loading regime score data: {e}")
             return None
     
-    def analyze_market_regime(self, data_sources: Dict[str, Any]) -> Dict[str, Any]:
+    def _summarize_assets(self, asset_data: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+        """
+        Precompute per-symbol close statistics shared by the regime and risk
+        passes so each DataFrame is touched once per report.
+
+        Returns:
+            Dict mapping symbol to {'last', 'sma_20', 'sma_50'} floats
+        """
+        symbols = [symbol for symbol, data in (asset_data or {}).items()
+                   if data is not None and len(data) > 20]
+        if not symbols:
+            return {}
+
+        # Stack the close tails into one NaN-padded (n_symbols, 50) matrix so
+        # all SMAs come from three vectorized reductions instead of a loop of
+        # per-symbol pandas calls
+        window = 50
+        close_mat = np.full((len(symbols), window), np.nan, dtype=np.float64)
+        lengths = np.empty(len(symbols), dtype=np.intp)
+        for i, symbol in enumerate(symbols):
+            tail = asset_data[symbol]['close'].to_numpy(dtype=np.float64, copy=False)[-window:]
+            close_mat[i, -len(tail):] = tail
+            lengths[i] = len(asset_data[symbol])
+
+        last = close_mat[:, -1]
+        sma_20 = close_mat[:, -20:].mean(axis=1)
+        # Series of 50 or fewer rows keep the original sma_20 fallback
+        sma_50 = np.where(lengths > 50, np.nanmean(close_mat, axis=1), sma_20)
+
+        return {symbol: {'last': float(last[i]),
+                         'sma_20': float(sma_20[i]),
+                         'sma_50': float(sma_50[i])}
+                for i, symbol in enumerate(symbols)}
+
+    def _build_snapshot(self, data_sources: Dict[str, Any],
+                        asset_summary: Optional[Dict[str, Dict[str, float]]] = None) -> MarketSnapshot:
+        """Validate data_sources once into a MarketSnapshot for the analyzers."""
+        vix_close = None
+        vix_data = data_sources.get('vix_data')
+        if vix_data is not None and len(vix_data) > 0:
+            if hasattr(vix_data, 'columns') and 'close' in vix_data.columns:
+                vix_close = vix_data['close'].to_numpy(dtype=np.float64, copy=False)
+            else:
+                vix_close = np.asarray(vix_data, dtype=np.float64).ravel()
+
+        fear_greed = None
+        fg_data = data_sources.get('fear_greed_data')
+        if fg_data is not None and len(fg_data) > 0:
+            fear_greed = np.asarray(fg_data, dtype=np.float64).ravel()
+
+        asset_data = data_sources.get('asset_data')
+        if asset_summary is None:
+            asset_summary = self._summarize_assets(asset_data)
+
+        return MarketSnapshot(
+            vix_close=vix_close,
+            fear_greed=fear_greed,
+            asset_summary=asset_summary,
+            n_assets=len(asset_data) if asset_data else 0,
+            calendar=data_sources.get('calendar_data') or None
+        )
+
+    def analyze_market_regime(self, data_sources: Dict[str, Any],
+                              asset_summary: Optional[Dict[str, Dict[str, float]]] = None,
+                              now_iso: Optional[str] = None,
+                              snapshot: Optional[MarketSnapshot] = None) -> Dict[str, Any]:
         """Analyze current market regime using multiple indicators."""
+        if snapshot is None:
+            snapshot = self._build_snapshot(data_sources, asset_summary)
+
         regime_analysis = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso or datetime.now().isoformat(),
             'overall_regime': 'Unknown',
             'confidence': 0.0,
             'indicators': {},
@@ -130,122 +371,104 @@ class EnhancedReportBuilder:
         }
         
         # VIX Analysis
-        if 'vix_data' in data_sources and data_sources['vix_data'] is not None:
-            vix_data = data_sources['vix_data']
-            if len(vix_data) > 0:
-                current_vix = vix_data['close'].iloc[-1] if 'close' in vix_data.columns else vix_data.iloc[-1]
-                avg_vix = vix_data['close'].mean() if 'close' in vix_data.columns else vix_data.mean()
-                
-                regime_analysis['indicators']['vix'] = {
-                    'current': current_vix,
-                    'average': avg_vix,
-                    'status': 'High' if current_vix > self.regime_thresholds['vix_high'] else 
-                             'Low' if current_vix < self.regime_thresholds['vix_low'] else 'Normal'
-                }
-                
-                if current_vix > self.regime_thresholds['vix_high']:
-                    regime_analysis['signals'].append('High volatility - defensive positioning recommended')
-                elif current_vix < self.regime_thresholds['vix_low']:
-                    regime_analysis['signals'].append('Low volatility - trend following favorable')
+        if snapshot.vix_close is not None and snapshot.vix_close.size:
+            current_vix = float(snapshot.vix_close[-1])
+            avg_vix = float(snapshot.vix_close.mean())
+
+            regime_analysis['indicators']['vix'] = {
+                'current': current_vix,
+                'average': avg_vix,
+                'status': 'High' if current_vix > self._VIX_HIGH else 
+                         'Low' if current_vix < self._VIX_LOW else 'Normal'
+            }
+
+            if current_vix > self._VIX_HIGH:
+                regime_analysis['signals'].append('High volatility - defensive positioning recommended')
+            elif current_vix < self._VIX_LOW:
+                regime_analysis['signals'].append('Low volatility - trend following favorable')
         
         # Fear & Greed Analysis
-        if 'fear_greed_data' in data_sources and data_sources['fear_greed_data'] is not None:
-            fg_data = data_sources['fear_greed_data']
-            if len(fg_data) > 0:
-                current_fg = fg_data.iloc[-1]
-                
-                regime_analysis['indicators']['fear_greed'] = {
-                    'current': current_fg,
-                    'status': 'Extreme Fear' if current_fg < self.regime_thresholds['fear_greed_extreme_fear'] else
-                             'Extreme Greed' if current_fg > self.regime_thresholds['fear_greed_extreme_greed'] else
-                             'Fear' if current_fg < 45 else 'Greed' if current_fg > 55 else 'Neutral'
-                }
-                
-                if current_fg < self.regime_thresholds['fear_greed_extreme_fear']:
-                    regime_analysis['signals'].append('Extreme fear - contrarian opportunities')
-                elif current_fg > self.regime_thresholds['fear_greed_extreme_greed']:
-                    regime_analysis['signals'].append('Extreme greed - risk reduction advised')
+        if snapshot.fear_greed is not None and snapshot.fear_greed.size:
+            current_fg = float(snapshot.fear_greed[-1])
+
+            regime_analysis['indicators']['fear_greed'] = {
+                'current': current_fg,
+                'status': 'Extreme Fear' if current_fg < self._FG_EXTREME_FEAR else
+                         'Extreme Greed' if current_fg > self._FG_EXTREME_GREED else
+                         'Fear' if current_fg < 45 else 'Greed' if current_fg > 55 else 'Neutral'
+            }
+
+            if current_fg < self._FG_EXTREME_FEAR:
+                regime_analysis['signals'].append('Extreme fear - contrarian opportunities')
+            elif current_fg > self._FG_EXTREME_GREED:
+                regime_analysis['signals'].append('Extreme greed - risk reduction advised')
         
         # Market Trend Analysis
-        if 'asset_data' in data_sources and data_sources['asset_data']:
-            asset_data = data_sources['asset_data']
+        if snapshot.asset_summary:
+            asset_summary = snapshot.asset_summary
             trend_signals = []
-            
-            for symbol, data in asset_data.items():
-                if data is not None and len(data) > 20:
-                    # Calculate trend indicators
-                    current_price = data['close'].iloc[-1]
-                    sma_20 = data['close'].rolling(20).mean().iloc[-1]
-                    sma_50 = data['close'].rolling(50).mean().iloc[-1] if len(data) > 50 else sma_20
-                    
-                    # Determine trend
-                    if current_price > sma_20 > sma_50:
-                        trend = 'Strong Bullish'
-                    elif current_price > sma_20 and sma_20 < sma_50:
-                        trend = 'Weak Bullish'
-                    elif current_price < sma_20 < sma_50:
-                        trend = 'Strong Bearish'
-                    elif current_price < sma_20 and sma_20 > sma_50:
-                        trend = 'Weak Bearish'
-                    else:
-                        trend = 'Sideways'
-                    
-                    trend_signals.append(f"{symbol}: {trend}")
-            
+            bullish_count = 0
+            bearish_count = 0
+
+            for symbol, stats in asset_summary.items():
+                current_price = stats['last']
+                sma_20 = stats['sma_20']
+                sma_50 = stats['sma_50']
+
+                # Determine trend, counting bullish/bearish as we classify
+                # so the scoring pass below needs no string re-scans
+                if current_price > sma_20 > sma_50:
+                    trend = 'Strong Bullish'
+                    bullish_count += 1
+                elif current_price > sma_20 and sma_20 < sma_50:
+                    trend = 'Weak Bullish'
+                    bullish_count += 1
+                elif current_price < sma_20 < sma_50:
+                    trend = 'Strong Bearish'
+                    bearish_count += 1
+                elif current_price < sma_20 and sma_20 > sma_50:
+                    trend = 'Weak Bearish'
+                    bearish_count += 1
+                else:
+                    trend = 'Sideways'
+
+                # Keep (symbol, trend) pairs; formatting into display
+                # strings is deferred to serialization time
+                trend_signals.append((symbol, trend))
+
             regime_analysis['indicators']['market_trends'] = trend_signals
+            regime_analysis['indicators']['trend_counts'] = {
+                'bullish': bullish_count,
+                'bearish': bearish_count
+            }
         
         # Economic Calendar Impact
-        if 'calendar_data' in data_sources and data_sources['calendar_data']:
-            calendar_data = data_sources['calendar_data']
+        if snapshot.calendar:
+            calendar_data = snapshot.calendar
             if calendar_data.get('success'):
                 high_impact_count = len(calendar_data.get('high_impact_events', []))
                 medium_impact_count = len(calendar_data.get('medium_impact_events', []))
-                
+
                 regime_analysis['indicators']['economic_events'] = {
                     'high_impact': high_impact_count,
                     'medium_impact': medium_impact_count,
                     'total_events': calendar_data.get('total_events', 0)
                 }
-                
+
                 if high_impact_count > 3:
                     regime_analysis['signals'].append('High economic event density - increased volatility expected')
         
-        # Determine overall regime
-        regime_score = 0
-        total_indicators = 0
-        
-        # VIX contribution
-        if 'vix' in regime_analysis['indicators']:
-            vix_status = regime_analysis['indicators']['vix']['status']
-            if vix_status == 'High':
-                regime_score -= 2
-            elif vix_status == 'Low':
-                regime_score += 1
-            total_indicators += 1
-        
-        # Fear & Greed contribution
-        if 'fear_greed' in regime_analysis['indicators']:
-            fg_status = regime_analysis['indicators']['fear_greed']['status']
-            if 'Extreme Fear' in fg_status:
-                regime_score += 2  # Contrarian bullish signal
-            elif 'Extreme Greed' in fg_status:
-                regime_score -= 2  # Contrarian bearish signal
-            elif 'Fear' in fg_status:
-                regime_score += 1
-            elif 'Greed' in fg_status:
-                regime_score -= 1
-            total_indicators += 1
-        
-        # Market trends contribution
-        if 'market_trends' in regime_analysis['indicators']:
-            bullish_count = sum(1 for signal in regime_analysis['indicators']['market_trends'] if 'Bullish' in signal)
-            bearish_count = sum(1 for signal in regime_analysis['indicators']['market_trends'] if 'Bearish' in signal)
-            
-            if bullish_count > bearish_count:
-                regime_score += 1
-            elif bearish_count > bullish_count:
-                regime_score -= 1
-            total_indicators += 1
+        # Determine overall regime via the integer scoring kernel
+        indicators = regime_analysis['indicators']
+        vix_code = _VIX_STATUS_CODE.get(indicators.get('vix', {}).get('status'), 0)
+        fg_code = _FG_STATUS_CODE.get(indicators.get('fear_greed', {}).get('status'), 0)
+        trend_counts = indicators.get('trend_counts')
+        regime_score, total_indicators = _score_regime(
+            vix_code, fg_code,
+            trend_counts['bullish'] if trend_counts else 0,
+            trend_counts['bearish'] if trend_counts else 0,
+            trend_counts is not None
+        )
         
         # Calculate overall regime
         if total_indicators > 0:
@@ -263,10 +486,11 @@ class EnhancedReportBuilder:
         
         return regime_analysis
     
-    def generate_strategy_recommendations(self, regime_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_strategy_recommendations(self, regime_analysis: Dict[str, Any],
+                                          now_iso: Optional[str] = None) -> Dict[str, Any]:
         """Generate strategy recommendations based on market regime analysis."""
         recommendations = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso or datetime.now().isoformat(),
             'primary_strategy': None,
             'secondary_strategy': None,
             'risk_level': 'Medium',
@@ -278,29 +502,20 @@ class EnhancedReportBuilder:
         regime = regime_analysis['overall_regime']
         confidence = regime_analysis['confidence']
         
-        # Determine primary strategy based on regime
-        if regime == 'Bullish' and confidence > 0.6:
-            if 'Low' in regime_analysis['indicators'].get('vix', {}).get('status', ''):
-                recommendations['primary_strategy'] = 'trend_following'
-            else:
-                recommendations['primary_strategy'] = 'momentum'
-        elif regime == 'Bearish' and confidence > 0.6:
-            if 'Extreme Fear' in regime_analysis['indicators'].get('fear_greed', {}).get('status', ''):
-                recommendations['primary_strategy'] = 'mean_reversion'
-            else:
-                recommendations['primary_strategy'] = 'defensive'
+        # Determine primary strategy via the precomputed decision table,
+        # computing the condition flags once instead of rescanning strings
+        indicators = regime_analysis['indicators']
+        vix_low = indicators.get('vix', {}).get('status') == 'Low'
+        extreme_fear = 'Extreme Fear' in indicators.get('fear_greed', {}).get('status', '')
+
+        if confidence > 0.6:
+            recommendations['primary_strategy'] = self._primary_map.get(
+                (regime, vix_low, extreme_fear), 'opportunistic')
         else:
             recommendations['primary_strategy'] = 'opportunistic'
-        
-        # Set secondary strategy
-        if recommendations['primary_strategy'] == 'trend_following':
-            recommendations['secondary_strategy'] = 'momentum'
-        elif recommendations['primary_strategy'] == 'mean_reversion':
-            recommendations['secondary_strategy'] = 'defensive'
-        elif recommendations['primary_strategy'] == 'defensive':
-            recommendations['secondary_strategy'] = 'opportunistic'
-        else:
-            recommendations['secondary_strategy'] = 'trend_following'
+
+        # Set secondary strategy from the transition map
+        recommendations['secondary_strategy'] = self._secondary_map[recommendations['primary_strategy']]
         
         # Get strategy details
         primary_details = self.strategy_playbook.get(recommendations['primary_strategy'], {})
@@ -332,10 +547,16 @@ class EnhancedReportBuilder:
         
         return recommendations
     
-    def generate_risk_assessment(self, data_sources: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_risk_assessment(self, data_sources: Dict[str, Any],
+                                 asset_summary: Optional[Dict[str, Dict[str, float]]] = None,
+                                 now_iso: Optional[str] = None,
+                                 snapshot: Optional[MarketSnapshot] = None) -> Dict[str, Any]:
         """Generate comprehensive risk assessment."""
+        if snapshot is None:
+            snapshot = self._build_snapshot(data_sources, asset_summary)
+
         risk_assessment = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso or datetime.now().isoformat(),
             'overall_risk_level': 'Medium',
             'risk_factors': [],
             'risk_score': 50,
@@ -345,40 +566,36 @@ class EnhancedReportBuilder:
         risk_score = 50  # Base score
         
         # VIX-based risk
-        if 'vix_data' in data_sources and data_sources['vix_data'] is not None:
-            vix_data = data_sources['vix_data']
-            if len(vix_data) > 0:
-                current_vix = vix_data['close'].iloc[-1] if 'close' in vix_data.columns else vix_data.iloc[-1]
-                
-                if current_vix > 30:
-                    risk_score += 20
-                    risk_assessment['risk_factors'].append(f'High VIX ({current_vix:.1f}) - elevated volatility risk')
-                elif current_vix > 25:
-                    risk_score += 10
-                    risk_assessment['risk_factors'].append(f'Moderate VIX ({current_vix:.1f}) - increased volatility')
-                elif current_vix < 15:
-                    risk_score -= 10
-                    risk_assessment['risk_factors'].append(f'Low VIX ({current_vix:.1f}) - complacency risk')
+        if snapshot.vix_close is not None and snapshot.vix_close.size:
+            current_vix = float(snapshot.vix_close[-1])
+
+            if current_vix > 30:
+                risk_score += 20
+                risk_assessment['risk_factors'].append(f'High VIX ({current_vix:.1f}) - elevated volatility risk')
+            elif current_vix > 25:
+                risk_score += 10
+                risk_assessment['risk_factors'].append(f'Moderate VIX ({current_vix:.1f}) - increased volatility')
+            elif current_vix < 15:
+                risk_score -= 10
+                risk_assessment['risk_factors'].append(f'Low VIX ({current_vix:.1f}) - complacency risk')
         
         # Fear & Greed risk
-        if 'fear_greed_data' in data_sources and data_sources['fear_greed_data'] is not None:
-            fg_data = data_sources['fear_greed_data']
-            if len(fg_data) > 0:
-                current_fg = fg_data.iloc[-1]
-                
-                if current_fg < 25:
-                    risk_score += 15
-                    risk_assessment['risk_factors'].append(f'Extreme fear ({current_fg:.1f}) - panic selling risk')
-                elif current_fg > 75:
-                    risk_score += 15
-                    risk_assessment['risk_factors'].append(f'Extreme greed ({current_fg:.1f}) - bubble risk')
+        if snapshot.fear_greed is not None and snapshot.fear_greed.size:
+            current_fg = float(snapshot.fear_greed[-1])
+
+            if current_fg < 25:
+                risk_score += 15
+                risk_assessment['risk_factors'].append(f'Extreme fear ({current_fg:.1f}) - panic selling risk')
+            elif current_fg > 75:
+                risk_score += 15
+                risk_assessment['risk_factors'].append(f'Extreme greed ({current_fg:.1f}) - bubble risk')
         
         # Economic event risk
-        if 'calendar_data' in data_sources and data_sources['calendar_data']:
-            calendar_data = data_sources['calendar_data']
+        if snapshot.calendar:
+            calendar_data = snapshot.calendar
             if calendar_data.get('success'):
                 high_impact_count = len(calendar_data.get('high_impact_events', []))
-                
+
                 if high_impact_count > 5:
                     risk_score += 15
                     risk_assessment['risk_factors'].append(f'High economic event density ({high_impact_count} events)')
@@ -387,21 +604,15 @@ class EnhancedReportBuilder:
                     risk_assessment['risk_factors'].append(f'Moderate economic event density ({high_impact_count} events)')
         
         # Market trend risk
-        if 'asset_data' in data_sources and data_sources['asset_data']:
-            asset_data = data_sources['asset_data']
-            bearish_count = 0
-            
-            for symbol, data in asset_data.items():
-                if data is not None and len(data) > 20:
-                    current_price = data['close'].iloc[-1]
-                    sma_20 = data['close'].rolling(20).mean().iloc[-1]
-                    
-                    if current_price < sma_20:
-                        bearish_count += 1
-            
-            if bearish_count > len(asset_data) * 0.7:
+        if snapshot.asset_summary:
+            below_sma = np.fromiter(
+                (stats['last'] < stats['sma_20'] for stats in snapshot.asset_summary.values()),
+                dtype=bool, count=len(snapshot.asset_summary))
+            bearish_count = int(below_sma.sum())
+
+            if bearish_count > snapshot.n_assets * 0.7:
                 risk_score += 15
-                risk_assessment['risk_factors'].append(f'Majority of assets in downtrend ({bearish_count}/{len(asset_data)})')
+                risk_assessment['risk_factors'].append(f'Majority of assets in downtrend ({bearish_count}/{snapshot.n_assets})')
         
         # Determine overall risk level
         risk_score = max(0, min(100, risk_score))
@@ -447,33 +658,48 @@ class EnhancedReportBuilder:
         regime_score_data = self.load_regime_score_data()
         
         # Generate all analyses
-        regime_analysis = self.analyze_market_regime(data_sources)
-        strategy_recommendations = self.generate_strategy_recommendations(regime_analysis)
-        risk_assessment = self.generate_risk_assessment(data_sources)
-        
-        # Generate visualizations
-        print(f"🔍 Data sources being passed to visualization engine:")
-        print(f"   Available keys: {list(data_sources.keys()) if data_sources else 'None'}")
-        
-        # Debug data structure
-        for key, value in data_sources.items():
-            if value is not None:
-                if isinstance(value, pd.DataFrame):
-                    print(f"   {key}: DataFrame with {len(value)} rows, columns: {list(value.columns)}")
-                elif isinstance(value, dict):
-                    print(f"   {key}: Dictionary with keys: {list(value.keys())}")
-                elif isinstance(value, pd.Series):
-                    print(f"   {key}: Series with {len(value)} values")
+        # Timestamp the whole report once instead of per sub-analysis
+        now_iso = datetime.now().isoformat()
+
+        # Validate data sources once into an array-backed snapshot shared
+        # by both analyzers
+        snapshot = self._build_snapshot(data_sources)
+
+        regime_analysis = self.analyze_market_regime(data_sources, now_iso=now_iso, snapshot=snapshot)
+        strategy_recommendations = self.generate_strategy_recommendations(regime_analysis, now_iso=now_iso)
+        risk_assessment = self.generate_risk_assessment(data_sources, now_iso=now_iso, snapshot=snapshot)
+        
+        # Generate visualizations; the data-structure dump is debug-only so
+        # normal runs skip the expensive DataFrame reprs entirely
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Data sources being passed to visualization engine:")
+            logger.debug("   Available keys: %s", list(data_sources.keys()) if data_sources else 'None')
+            for key, value in data_sources.items():
+                if value is not None:
+                    if isinstance(value, pd.DataFrame):
+                        logger.debug("   %s: DataFrame with %d rows, columns: %s", key, len(value), value.columns)
+                    elif isinstance(value, dict):
+                        logger.debug("   %s: Dictionary with keys: %s", key, list(value.keys()))
+                    elif isinstance(value, pd.Series):
+                        logger.debug("   %s: Series with %d values", key, len(value))
+                    else:
+                        logger.debug("   %s: %s - %.100s...", key, type(value), value)
                 else:
-                    print(f"   {key}: {type(value)} - {str(value)[:100]}...")
-            else:
-                print(f"   {key}: None")
-        
+                    logger.debug("   %s: None", key)
+
         viz_results = self.viz_engine.generate_all_visualizations(data_sources)
-        
+
+        # Format the structured (symbol, trend) pairs into display strings
+        # only now that the report is actually being serialized
+        trend_pairs = regime_analysis['indicators'].get('market_trends')
+        if trend_pairs:
+            regime_analysis['indicators']['market_trends'] = [
+                f"{symbol}: {trend}" for symbol, trend in trend_pairs
+            ]
+
         # Compile comprehensive report
         report = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso,
             'report_type': 'comprehensive_market_intelligence',
             'executive_summary': {
                 'market_regime': regime_analysis['overall_regime'],
@@ -498,13 +724,23 @@ class EnhancedReportBuilder:
             }
         }
         
-        # Save report
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        # Save report; integer f-string formatting skips strftime's format parse
+        tm = time.localtime()
+        timestamp = f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}_{tm.tm_hour:02d}{tm.tm_min:02d}"
         report_filename = f"comprehensive_report_{timestamp}.json"
-        report_path = os.path.join(self.output_dir, report_filename)
+        report_path = str(self._output_dir_path / report_filename)
         
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            report_bytes = orjson.dumps(
+                report, default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            report_bytes = json.dumps(report, indent=2, default=str).encode('utf-8')
+
+        write_future = self._writer.submit(_atomic_write, report_path, report_bytes)
+        write_future.add_done_callback(
+            lambda f, path=report_path: f.exception() and print(
+                f"❌ Failed to save comprehensive report to {path}: {f.exception()}"))
         
         print(f"✅ Comprehensive report saved to {report_path}")
         print(f"📊 Report Summary:")
@@ -522,17 +758,23 @@ def main():
     
     # Create sample data for testing
     dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='D')
-    
+    n = len(dates)
+
+    # Draw all the noise in one Generator call, then scale/shift per series;
+    # the modern bit generator avoids the legacy RandomState lock per call
+    rng = np.random.default_rng(0)
+    noise = rng.standard_normal((5, n))
+
     # Sample data sources
     data_sources = {
         'vix_data': pd.DataFrame({
-            'close': np.random.normal(20, 5, len(dates)) + 15
+            'close': noise[0] * 5 + 35
         }, index=dates),
-        'fear_greed_data': pd.Series(np.random.normal(50, 15, len(dates)), index=dates),
+        'fear_greed_data': pd.Series(noise[1] * 15 + 50, index=dates),
         'asset_data': {
-            'SPY': pd.DataFrame({'close': np.random.normal(400, 10, len(dates)) + 380}, index=dates),
-            'QQQ': pd.DataFrame({'close': np.random.normal(350, 15, len(dates)) + 330}, index=dates),
-            'GLD': pd.DataFrame({'close': np.random.normal(180, 5, len(dates)) + 175}, index=dates)
+            'SPY': pd.DataFrame({'close': noise[2] * 10 + 780}, index=dates),
+            'QQQ': pd.DataFrame({'close': noise[3] * 15 + 680}, index=dates),
+            'GLD': pd.DataFrame({'close': noise[4] * 5 + 355}, index=dates)
         },
         'calendar_data': {
             'success': True,